@@ -1,8 +1,11 @@
 import json
 import logging
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 import requests
@@ -44,12 +47,146 @@ def filter_df_by_period(df: pd.DataFrame, start: datetime, end: datetime) -> pd.
     return data.loc[(data["date"] >= start) & (data["date"] <= end)].copy()
 
 
-def read_user_settings(path: str = "user_settings.json") -> Dict[str, Any]:
+DEFAULT_USER_ID = "default"
+DEFAULT_USER_SETTINGS: Dict[str, List[str]] = {"user_currencies": ["USD", "EUR"], "user_stocks": []}
+_USER_SETTINGS_KEYS = ("user_currencies", "user_stocks")
+
+
+def default_user_settings() -> Dict[str, Any]:
+    """Возвращает копию настроек по умолчанию (для отсутствующего файла)."""
+    return {key: list(value) for key, value in DEFAULT_USER_SETTINGS.items()}
+
+
+def validate_user_settings(raw: Any) -> Dict[str, Any]:
+    """Проверяет настройки пользователя; отсутствующие списки считаются пустыми.
+
+    Raises:
+        ValueError: если настройки не объект или списки содержат не строки.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("user settings must be a JSON object")
+    settings = dict(raw)
+    for key in _USER_SETTINGS_KEYS:
+        value = settings.get(key, [])
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise ValueError(f"{key} must be a list of strings")
+        settings[key] = list(value)
+    return settings
+
+
+def read_user_settings(path: Union[str, Path] = "user_settings.json") -> Dict[str, Any]:
     p = Path(path)
     if not p.exists():
-        return {"user_currencies": ["USD", "EUR"], "user_stocks": []}
+        return default_user_settings()
     with p.open("r", encoding="utf-8") as f:
-        return json.load(f)
+        return validate_user_settings(json.load(f))
+
+
+@dataclass
+class _SettingsEntry:
+    settings: Dict[str, Any]
+    path: Optional[Path] = None
+    signature: Optional[Tuple[int, int]] = None
+    checked_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class UserSettingsRegistry:
+    """Кэш разобранных настроек пользователей с перезагрузкой по mtime и размеру файла.
+
+    Файл проверяется не чаще раза в ``check_interval`` секунд. Stat и, если mtime или
+    размер изменились, чтение файла выполняет тот запрос, который первым заметил истечение
+    интервала; остальные в это время получают закэшированные настройки без ожидания.
+    Неудачное чтение повторяется на следующем интервале, прежние настройки сохраняются.
+    """
+
+    def __init__(self, check_interval: float = 1.0) -> None:
+        self._check_interval = check_interval
+        self._entries: Dict[str, _SettingsEntry] = {}
+        self._lock = threading.Lock()
+
+    def register(self, user_id: str, path: Union[str, Path], strict: bool = True) -> None:
+        """Привязывает пользователя к файлу настроек и сразу загружает его.
+
+        Args:
+            user_id: Идентификатор пользователя.
+            path: Путь к JSON-файлу настроек.
+            strict: Если False, ошибка чтения логируется, пользователь получает настройки
+                по умолчанию до исправления файла.
+
+        Raises:
+            ValueError: если файл содержит некорректные настройки и strict=True.
+        """
+        entry = _SettingsEntry(settings=default_user_settings(), path=Path(path))
+        try:
+            self._reload(entry)
+        except (OSError, ValueError) as exc:
+            if strict:
+                raise
+            logger.error(f"User settings load error ({entry.path}): {exc}")
+        with self._lock:
+            self._entries[user_id] = entry
+
+    def put(self, user_id: str, settings: Dict[str, Any]) -> None:
+        """Сохраняет настройки пользователя только в памяти, без файла."""
+        entry = _SettingsEntry(settings=validate_user_settings(settings))
+        with self._lock:
+            self._entries[user_id] = entry
+
+    def get(self, user_id: str = DEFAULT_USER_ID) -> Dict[str, Any]:
+        """Возвращает настройки пользователя (результат не следует изменять).
+
+        Raises:
+            KeyError: если пользователь не зарегистрирован.
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            raise KeyError(f"Unknown user: {user_id}")
+        if entry.path is not None and time.monotonic() - entry.checked_at >= self._check_interval:
+            if entry.lock.acquire(blocking=False):
+                try:
+                    self._reload(entry)
+                except (OSError, ValueError) as exc:
+                    # Оставляем прежние настройки, пока файл не исправят
+                    logger.error(f"User settings reload error ({entry.path}): {exc}")
+                finally:
+                    entry.lock.release()
+        return entry.settings
+
+    def _reload(self, entry: _SettingsEntry) -> None:
+        assert entry.path is not None
+        entry.checked_at = time.monotonic()
+        try:
+            stat = entry.path.stat()
+            signature: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+        if signature == entry.signature:
+            return
+        # Подпись запоминаем только после успешного чтения, иначе повторим на следующем интервале
+        entry.settings = read_user_settings(entry.path) if signature is not None else default_user_settings()
+        entry.signature = signature
+
+
+_default_registry: Optional[UserSettingsRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_settings_registry() -> UserSettingsRegistry:
+    """Общий реестр с пользователем по умолчанию (user_settings.json); создается при первом вызове.
+
+    Некорректный файл не мешает созданию: пользователь получает настройки по умолчанию,
+    а файл перечитывается реестром на следующих интервалах.
+    """
+    global _default_registry
+    if _default_registry is not None:
+        return _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            registry = UserSettingsRegistry()
+            registry.register(DEFAULT_USER_ID, "user_settings.json", strict=False)
+            _default_registry = registry
+        return _default_registry
 
 
 def fetch_currency_rates(codes: List[str]) -> List[Dict[str, Any]]:
@@ -5,11 +5,13 @@ from typing import Any, Dict, List, Optional
 import pandas as pd
 
 from .utils import (
+    DEFAULT_USER_ID,
+    UserSettingsRegistry,
     fetch_currency_rates,
     fetch_stock_prices,
     filter_df_by_period,
+    get_default_settings_registry,
     get_period,
-    read_user_settings,
 )
 logger = logging.getLogger(__name__)
 
@@ -28,13 +30,21 @@ def _build_top_categories(df_part: pd.DataFrame, top_n: int = 7) -> List[Dict[st
     return items
 
 
-def events_view(date_str: str, scope: str = "M", df: Optional[pd.DataFrame] = None) -> str:
+def events_view(
+    date_str: str,
+    scope: str = "M",
+    df: Optional[pd.DataFrame] = None,
+    user_id: str = DEFAULT_USER_ID,
+    registry: Optional[UserSettingsRegistry] = None,
+) -> str:
     """Функция страницы «События».
 
     Args:
         date_str: Дата в формате YYYY-MM-DD.
         scope: W|M|Y|ALL — период.
         df: DataFrame транзакций (если None — ошибка).
+        user_id: Пользователь, чьи настройки используются.
+        registry: Реестр настроек (по умолчанию — общий, с user_settings.json).
 
     Returns:
         JSON-строка по ТЗ: расходы (total, main, transfers_and_cash), доходы (total, main),
@@ -73,7 +83,7 @@ def events_view(date_str: str, scope: str = "M", df: Optional[pd.DataFrame] = No
     income_total = int(round(income_df["amount"].sum())) if not income_df.empty else 0
     income_main = _build_top_categories(income_df, top_n=7)
 
-    settings = read_user_settings()
+    settings = (registry or get_default_settings_registry()).get(user_id)
     currency_rates = fetch_currency_rates(settings.get("user_currencies", []))
     stock_prices = fetch_stock_prices(settings.get("user_stocks", []))
 
@@ -0,0 +1,184 @@
+import json
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import (
+    DEFAULT_USER_SETTINGS,
+    UserSettingsRegistry,
+    get_default_settings_registry,
+    read_user_settings,
+    validate_user_settings,
+)
+
+
+def _write(path, data, mtime_ns):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_validate_user_settings_missing_keys_are_empty():
+    assert validate_user_settings({"user_stocks": ["AAPL"]}) == {"user_currencies": [], "user_stocks": ["AAPL"]}
+
+
+@pytest.mark.parametrize('raw', [[], {"user_currencies": "USD"}, {"user_stocks": [1]}])
+def test_validate_user_settings_invalid(raw):
+    with pytest.raises(ValueError):
+        validate_user_settings(raw)
+
+
+def test_read_user_settings_missing_file(tmp_path):
+    assert read_user_settings(tmp_path / 'absent.json') == DEFAULT_USER_SETTINGS
+
+
+def test_read_user_settings_malformed_file(tmp_path):
+    path = tmp_path / 'settings.json'
+    path.write_text("{broken", encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_user_settings(path)
+
+
+def test_registry_missing_file_uses_defaults(tmp_path):
+    registry = UserSettingsRegistry()
+    registry.register('u', tmp_path / 'absent.json')
+    assert registry.get('u') == DEFAULT_USER_SETTINGS
+
+
+def test_registry_defaults_are_not_shared(tmp_path):
+    registry = UserSettingsRegistry()
+    registry.register('u', tmp_path / 'absent.json')
+    registry.get('u')["user_stocks"].append('HACK')
+    assert DEFAULT_USER_SETTINGS["user_stocks"] == []
+
+
+def test_registry_register_malformed_file_raises(tmp_path):
+    path = tmp_path / 'settings.json'
+    path.write_text("{broken", encoding="utf-8")
+    with pytest.raises(ValueError):
+        UserSettingsRegistry().register('u', path)
+
+
+def test_registry_put_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        UserSettingsRegistry().put('u', {"user_stocks": "AAPL"})
+
+
+def test_registry_reloads_on_mtime_change(tmp_path):
+    path = tmp_path / 'settings.json'
+    _write(path, {"user_currencies": ["USD"]}, 1_000_000_000)
+    registry = UserSettingsRegistry(check_interval=0)
+    registry.register('u', path)
+    assert registry.get('u')["user_currencies"] == ["USD"]
+
+    _write(path, {"user_currencies": ["CNY"]}, 2_000_000_000)
+    assert registry.get('u')["user_currencies"] == ["CNY"]
+
+
+def test_registry_falls_back_to_defaults_when_file_deleted(tmp_path):
+    path = tmp_path / 'settings.json'
+    _write(path, {"user_stocks": ["AAPL"]}, 1_000_000_000)
+    registry = UserSettingsRegistry(check_interval=0)
+    registry.register('u', path)
+
+    path.unlink()
+    assert registry.get('u') == DEFAULT_USER_SETTINGS
+
+
+def test_registry_caches_within_interval(tmp_path):
+    path = tmp_path / 'settings.json'
+    _write(path, {"user_stocks": ["AAPL"]}, 1_000_000_000)
+    registry = UserSettingsRegistry(check_interval=3600)
+    registry.register('u', path)
+
+    _write(path, {"user_stocks": ["MSFT"]}, 2_000_000_000)
+    assert registry.get('u')["user_stocks"] == ["AAPL"]
+
+
+def test_registry_retries_broken_file_until_read_succeeds(tmp_path):
+    path = tmp_path / 'settings.json'
+    _write(path, {"user_stocks": ["AAPL"]}, 1_000_000_000)
+    registry = UserSettingsRegistry(check_interval=0)
+    registry.register('u', path)
+
+    path.write_text('{"user_sto', encoding="utf-8")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert registry.get('u')["user_stocks"] == ["AAPL"]
+
+    # Запись завершилась в тот же тик mtime
+    _write(path, {"user_stocks": ["MSFT"]}, 2_000_000_000)
+    assert registry.get('u')["user_stocks"] == ["MSFT"]
+
+
+def test_registry_detects_same_mtime_rewrite_by_size(tmp_path):
+    path = tmp_path / 'settings.json'
+    _write(path, {"user_stocks": ["AAPL"]}, 1_000_000_000)
+    registry = UserSettingsRegistry(check_interval=0)
+    registry.register('u', path)
+
+    _write(path, {"user_stocks": ["AAPL", "MSFT"]}, 1_000_000_000)
+    assert registry.get('u')["user_stocks"] == ["AAPL", "MSFT"]
+
+
+def test_registry_skips_read_when_file_unchanged(tmp_path):
+    path = tmp_path / 'settings.json'
+    _write(path, {"user_stocks": ["AAPL"]}, 1_000_000_000)
+    registry = UserSettingsRegistry(check_interval=0)
+    registry.register('u', path)
+
+    with patch('src.utils.read_user_settings', wraps=read_user_settings) as mock_read:
+        for _ in range(5):
+            registry.get('u')
+    assert mock_read.call_count == 0
+
+
+def test_registry_register_non_strict_falls_back_to_defaults(tmp_path):
+    path = tmp_path / 'settings.json'
+    path.write_text("{broken", encoding="utf-8")
+    registry = UserSettingsRegistry(check_interval=0)
+    registry.register('u', path, strict=False)
+    assert registry.get('u') == DEFAULT_USER_SETTINGS
+
+    _write(path, {"user_stocks": ["AAPL"]}, 1_000_000_000)
+    assert registry.get('u')["user_stocks"] == ["AAPL"]
+
+
+def test_registry_get_does_not_wait_for_reload(tmp_path):
+    path = tmp_path / 'settings.json'
+    _write(path, {"user_stocks": ["AAPL"]}, 1_000_000_000)
+    registry = UserSettingsRegistry(check_interval=0)
+    registry.register('u', path)
+    _write(path, {"user_stocks": ["MSFT"]}, 2_000_000_000)
+
+    reading = threading.Event()
+    release = threading.Event()
+
+    def slow_read(p):
+        reading.set()
+        release.wait(5)
+        return read_user_settings(p)
+
+    with patch('src.utils.read_user_settings', side_effect=slow_read):
+        reloader = threading.Thread(target=registry.get, args=('u',))
+        reloader.start()
+        assert reading.wait(5)
+
+        results = []
+        reader = threading.Thread(target=lambda: results.append(registry.get('u')))
+        reader.start()
+        reader.join(1)
+        alive = reader.is_alive()
+        release.set()
+        reloader.join(5)
+        reader.join(5)
+
+    assert not alive
+    assert results[0]["user_stocks"] == ["AAPL"]
+    assert registry.get('u')["user_stocks"] == ["MSFT"]
+
+
+def test_default_registry_is_shared():
+    registry = get_default_settings_registry()
+    assert registry is get_default_settings_registry()
+    assert set(registry.get()) >= {"user_currencies", "user_stocks"}
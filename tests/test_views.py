@@ -2,6 +2,7 @@ import pandas as pd
 import pytest
 from unittest.mock import patch
 
+from src.utils import UserSettingsRegistry
 from src.views import events_view
 import json
 
@@ -36,3 +37,17 @@ def test_events_view_scopes(mock_stocks, mock_rates, scope, df_events):
     res = json.loads(res_json)
     assert 'expenses' in res and 'income' in res
 
+
+@patch('src.views.fetch_stock_prices', return_value=[])
+@patch('src.views.fetch_currency_rates', return_value=[])
+def test_events_view_uses_user_settings(mock_rates, mock_stocks, df_events):
+    registry = UserSettingsRegistry()
+    registry.put('alice', {"user_currencies": ["GBP"], "user_stocks": ["TSLA"]})
+    events_view('2024-01-10', 'M', df_events, user_id='alice', registry=registry)
+    mock_rates.assert_called_once_with(["GBP"])
+    mock_stocks.assert_called_once_with(["TSLA"])
+
+
+def test_events_view_unknown_user(df_events):
+    with pytest.raises(KeyError):
+        events_view('2024-01-10', 'M', df_events, user_id='nobody', registry=UserSettingsRegistry())